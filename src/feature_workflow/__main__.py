@@ -0,0 +1,46 @@
+"""Entry point for ``python -m feature_workflow`` with minimal import cost.
+
+The typer/rich CLI in ``cli.py`` is convenient but expensive to import.
+Trivial commands (``version``, ``server-start``) are dispatched here with
+stdlib argparse so they never pull in typer, rich, or pydantic-settings;
+everything else falls through to the full CLI, imported lazily.
+"""
+
+import argparse
+import sys
+from typing import Optional
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Dispatch a CLI invocation, deferring heavy imports until needed."""
+    args = sys.argv[1:] if argv is None else argv
+
+    parser = argparse.ArgumentParser(
+        prog="feature-workflow-mcp",
+        add_help=False,
+    )
+    parser.add_argument("command", nargs="?")
+    namespace, _ = parser.parse_known_args(args)
+    command = (namespace.command or "").replace("-", "_")
+
+    if command == "version":
+        from . import __version__
+        print(f"Feature Workflow MCP Server v{__version__}")
+        return
+
+    if command == "server_start":
+        # MCP servers communicate via stdin/stdout, so no console output
+        from .server import main as server_main
+        try:
+            server_main()
+        except KeyboardInterrupt:
+            pass  # Exit silently on Ctrl+C
+        return
+
+    # Everything else goes through the full typer CLI
+    from .cli import app
+    app(args)
+
+
+if __name__ == "__main__":
+    main()
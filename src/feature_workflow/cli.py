@@ -1,15 +1,7 @@
 """Command line interface for feature workflow MCP server."""
 
-import asyncio
-from pathlib import Path
-from typing import Optional
-
 import typer
 from rich.console import Console
-from rich.table import Table
-
-from .config import config
-from .models.workspace import WorkspaceStatus
 
 app = typer.Typer(
     name="feature-workflow-mcp",
@@ -19,6 +11,13 @@ app = typer.Typer(
 console = Console()
 
 
+def _get_config():
+    """Load the configuration lazily so cheap commands skip pydantic imports."""
+    from .config import config
+
+    return config
+
+
 @app.command()
 def version():
     """Show version information."""
@@ -29,6 +28,7 @@ def version():
 @app.command()
 def config_show():
     """Show current configuration."""
+    config = _get_config()
     console.print("Current Configuration:")
     console.print(f"  Worktrees Directory: {config.workspace.worktrees_dir}")
     console.print(f"  Max Worktrees: {config.workspace.max_worktrees}")
@@ -41,41 +41,68 @@ def config_show():
     console.print(f"  Debug Mode: {config.debug}")
 
 
+# Render at most this many table rows before cropping; Rich's cell
+# measurement gets expensive for very long tables
+_MAX_TABLE_ROWS = 200
+
+
 @app.command()
 def workspace_list():
     """List all feature workspaces."""
     import asyncio
+    import sys
+
     from .managers.workspace_manager import WorkspaceManager
-    
+
+    config = _get_config()
+
     async def _list_workspaces():
         manager = WorkspaceManager(config)
         workspace_list = await manager.list_workspaces()
-        
+
         if not workspace_list.workspaces:
             console.print("No workspaces found.")
             return
-        
-        table = Table(title="Feature Worktrees")
-        table.add_column("Name", style="cyan")
-        table.add_column("Issue", style="magenta")
-        table.add_column("Status", style="green")
-        table.add_column("Branch", style="blue")
-        table.add_column("Active", style="yellow")
-        table.add_column("Path", style="dim")
-        
-        for workspace in workspace_list.workspaces:
-            is_active = "✓" if workspace.name == workspace_list.active_workspace else ""
-            table.add_row(
+
+        rows = [
+            (
                 workspace.name,
                 workspace.issue_id,
                 workspace.status.value,
                 workspace.branch_name,
-                is_active,
-                str(workspace.path)
+                "✓" if workspace.name == workspace_list.active_workspace else "",
+                str(workspace.path),
             )
-        
+            for workspace in workspace_list.workspaces
+        ]
+
+        if not console.is_terminal:
+            # Piped output: skip Rich entirely and emit plain TSV
+            for row in rows:
+                sys.stdout.write("\t".join(row) + "\n")
+            return
+
+        from rich.table import Column, Table
+
+        table = Table(
+            Column("Name", style="cyan"),
+            Column("Issue", style="magenta"),
+            Column("Status", style="green"),
+            Column("Branch", style="blue"),
+            Column("Active", style="yellow"),
+            Column("Path", style="dim"),
+            title="Feature Worktrees",
+            show_lines=False,
+            expand=False,
+        )
+
+        for row in rows[:_MAX_TABLE_ROWS]:
+            table.add_row(*row)
+        if len(rows) > _MAX_TABLE_ROWS:
+            table.add_row(f"... ({len(rows) - _MAX_TABLE_ROWS} more)", "", "", "", "", "")
+
         console.print(table)
-    
+
     asyncio.run(_list_workspaces())
 
 
@@ -85,11 +112,12 @@ def workspace_clean(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be cleaned without actually doing it"),
 ):
     """Clean up old workspaces."""
+    config = _get_config()
     workspace_dir = config.workspace_base_dir
     if not workspace_dir.exists():
         console.print("No workspaces found.")
         return
-    
+
     # TODO: Implement cleanup logic
     if dry_run:
         console.print(f"Would clean workspaces older than {days} days")
@@ -103,7 +131,7 @@ def server_start():
     # Import and run the MCP server directly without console output
     # MCP servers communicate via stdin/stdout, so we can't print to stdout
     from .server import main
-    
+
     try:
         main()
     except KeyboardInterrupt:
@@ -116,4 +144,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,6 +1,6 @@
 """Configuration management for feature workflow MCP server."""
 
-import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -117,14 +117,14 @@ class FeatureWorkflowConfig(BaseSettings):
         """Get the active workspace tracking file (stored in current repo)."""
         return Path.cwd() / ".feature-workflow" / "active-workspace"
     
-    @property
+    @cached_property
     def worktrees_metadata_dir(self) -> Path:
-        """Get the worktrees metadata directory."""
+        """Get the worktrees metadata directory (created on first access)."""
         metadata_dir = Path.cwd() / ".feature-workflow"
         metadata_dir.mkdir(parents=True, exist_ok=True)
         return metadata_dir
-    
-    @property
+
+    @cached_property
     def workspace_base_dir(self) -> Path:
         """Get the base directory for all workspaces."""
         return Path.cwd() / self.workspace.worktrees_dir
@@ -136,5 +136,15 @@ class FeatureWorkflowConfig(BaseSettings):
         return worktree_dir
 
 
-# Global configuration instance
-config = FeatureWorkflowConfig()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> FeatureWorkflowConfig:
+    """Get the global configuration instance, constructing it on first use."""
+    return FeatureWorkflowConfig()
+
+
+def __getattr__(name: str) -> FeatureWorkflowConfig:
+    # Keep `from .config import config` working without paying for
+    # settings construction (env file reads, validators) at import time.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,17 +1,28 @@
 """Git operations manager for feature development with worktree support."""
 
 import asyncio
+import configparser
 import re
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Tuple
 
 import git
 from git import Repo, GitCommandError
 
 from ..config import FeatureWorkflowConfig
-from ..models.workspace import WorkspaceMetadata, GitInfo
+from ..models.workspace import GitInfo
 from .worktree_manager import WorktreeManager
 
+# Basic validation for common git URL formats
+_GIT_URL_RE = re.compile(
+    r'^(https?://|git@|ssh://([a-zA-Z0-9._-]+@)?)'
+    r'[a-zA-Z0-9.-]+'
+    r'[:/]'
+    r'[a-zA-Z0-9._-]+/'
+    r'[a-zA-Z0-9._-]+'
+    r'(\.git)?/?$'
+)
+
 
 class GitManager:
     """Manages git operations for feature workspaces using worktrees."""
@@ -19,26 +30,61 @@ class GitManager:
     def __init__(self, config: FeatureWorkflowConfig):
         self.config = config
         self.worktree_manager = WorktreeManager(config)
-    
+        # Repos whose user config has already been checked this process
+        self._user_configured: set[str] = set()
+        # Repo objects reused across calls; construction re-reads config
+        # and scans refs every time otherwise
+        self._repo_cache: dict[Path, Repo] = {}
+
+    async def get_repo(self, path: Path) -> Repo:
+        """Get a (cached) Repo for a path, raising ValueError if invalid."""
+        repo = self._repo_cache.get(path)
+        if repo is None:
+            try:
+                repo = await asyncio.to_thread(Repo, path)
+            except git.InvalidGitRepositoryError:
+                raise ValueError(f"No git repository found at {path}")
+            self._repo_cache[path] = repo
+        return repo
+
+    async def _run_git(self, working_dir: Path, *args: str) -> str:
+        """Run a git command via async subprocess without blocking the loop."""
+        proc = await asyncio.create_subprocess_exec(
+            "git", "-C", str(working_dir), *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise GitCommandError(["git", *args], proc.returncode, stderr.decode())
+        return stdout.decode().strip()
+
     async def ensure_repository(self, repo_path: Path = None) -> Repo:
         """Ensure we have a git repository to work with."""
         if repo_path is None:
             repo_path = Path.cwd()
-        
+
         try:
-            repo = Repo(repo_path)
-            
-            # Configure git user if not set
-            try:
-                repo.config_reader().get_value("user", "name")
-            except:
-                with repo.config_writer() as git_config:
-                    git_config.set_value("user", "name", self.config.git.user_name)
-                    git_config.set_value("user", "email", self.config.git.user_email)
-            
+            repo = await asyncio.to_thread(Repo, repo_path)
+            self._ensure_user_configured(repo)
             return repo
         except git.InvalidGitRepositoryError:
             raise ValueError(f"No git repository found at {repo_path}")
+
+    def _ensure_user_configured(self, repo: Repo) -> None:
+        """Configure git user if not set (checked once per repo per process)."""
+        working_dir = str(repo.working_dir)
+        if working_dir in self._user_configured:
+            return
+
+        try:
+            repo.config_reader().get_value("user", "name")
+        except (configparser.NoOptionError, configparser.NoSectionError):
+            with repo.config_writer() as git_config:
+                git_config.set_value("user", "name", self.config.git.user_name)
+                git_config.set_value("user", "email", self.config.git.user_email)
+
+        self._user_configured.add(working_dir)
     
     async def create_worktree_for_feature(
         self,
@@ -58,14 +104,19 @@ class GitManager:
     async def create_feature_branch(self, repo: Repo, branch_name: str, base_branch: str = "main") -> None:
         """Create and checkout feature branch."""
         try:
+            # Snapshot branch/ref names once; repeated repo.heads/repo.refs
+            # access re-walks packed-refs on large repos
+            heads = {head.name: head for head in repo.heads}
+
             # Ensure we're on the base branch
-            if base_branch in repo.heads:
-                repo.heads[base_branch].checkout()
+            if base_branch in heads:
+                heads[base_branch].checkout()
             else:
                 # If base branch doesn't exist locally, create it from origin
-                if f"origin/{base_branch}" in [ref.name for ref in repo.refs]:
-                    repo.create_head(base_branch, f"origin/{base_branch}")
-                    repo.heads[base_branch].checkout()
+                ref_names = {ref.name for ref in repo.refs}
+                if f"origin/{base_branch}" in ref_names:
+                    base_head = repo.create_head(base_branch, f"origin/{base_branch}")
+                    base_head.checkout()
                 else:
                     raise ValueError(f"Base branch '{base_branch}' not found")
             
@@ -85,8 +136,8 @@ class GitManager:
     ) -> str:
         """Commit changes with Linear issue reference."""
         try:
-            # Stage all changes
-            repo.git.add(A=True)
+            # Stage all changes (subprocess so concurrent requests overlap)
+            await self._run_git(Path(repo.working_dir), "add", "-A")
             
             # Check if there are changes to commit
             if not repo.index.diff("HEAD"):
@@ -106,25 +157,28 @@ class GitManager:
     async def push_branch(self, repo: Repo, branch_name: str) -> None:
         """Push branch to remote."""
         try:
-            origin = repo.remote('origin')
-            origin.push(branch_name)
+            await self._run_git(Path(repo.working_dir), "push", "origin", branch_name)
         except GitCommandError as e:
             raise ValueError(f"Failed to push branch: {e}")
-    
+
     async def sync_with_base(self, repo: Repo, base_branch: str = "main") -> Tuple[int, int]:
         """Sync feature branch with base branch."""
         try:
             # Fetch latest changes
-            repo.remote('origin').fetch()
+            await self._run_git(Path(repo.working_dir), "fetch", "origin")
             
             # Get current branch
             current_branch = repo.active_branch.name
-            
-            # Get commits ahead and behind
-            commits_ahead = list(repo.iter_commits(f"origin/{base_branch}..{current_branch}"))
-            commits_behind = list(repo.iter_commits(f"{current_branch}..origin/{base_branch}"))
-            
-            return len(commits_ahead), len(commits_behind)
+
+            # Count commits ahead and behind in one graph walk:
+            # left = only on origin/base (behind), right = only on us (ahead)
+            out = await self._run_git(
+                Path(repo.working_dir), "rev-list", "--left-right", "--count",
+                f"origin/{base_branch}...{current_branch}"
+            )
+            commits_behind, commits_ahead = map(int, out.split())
+
+            return commits_ahead, commits_behind
             
         except GitCommandError as e:
             raise ValueError(f"Failed to sync with base branch: {e}")
@@ -139,6 +193,7 @@ class GitManager:
     
     async def remove_worktree(self, repo: Repo, worktree_path: Path) -> bool:
         """Remove a worktree."""
+        self._repo_cache.pop(worktree_path, None)
         return await self.worktree_manager.remove_worktree(repo, worktree_path)
     
     async def sync_worktree_with_base(
@@ -155,7 +210,7 @@ class GitManager:
     async def is_git_repository(self, path: Path) -> bool:
         """Check if path is a git repository."""
         try:
-            Repo(path)
+            await asyncio.to_thread(Repo, path)
             return True
         except:
             return False
@@ -176,38 +231,35 @@ class GitManager:
         
         return formatted_message
     
-    async def validate_repository_url(self, repo_url: str) -> bool:
+    def validate_repository_url(self, repo_url: str) -> bool:
         """Validate repository URL format."""
-        # Basic validation for common git URL formats
-        git_url_pattern = re.compile(
-            r'^(https?://|git@|ssh://)'
-            r'[a-zA-Z0-9.-]+'
-            r'[:/]'
-            r'[a-zA-Z0-9._-]+/'
-            r'[a-zA-Z0-9._-]+'
-            r'(\.git)?/?$'
-        )
-        
-        return bool(git_url_pattern.match(repo_url))
+        # Pure string check; no coroutine overhead needed
+        return _GIT_URL_RE.match(repo_url) is not None
     
-    async def get_default_branch(self, repo: Repo) -> str:
-        """Get the default branch for the repository."""
+    async def get_default_branch(self, repo: Repo, fetch: bool = False) -> str:
+        """Get the default branch for the repository.
+
+        Cached remote refs are usually enough to answer this; pass
+        ``fetch=True`` to force a network round trip first.
+        """
         try:
-            # Try to get default branch from remote
-            origin = repo.remote('origin')
-            origin.fetch()
-            
+            if fetch:
+                await self._run_git(Path(repo.working_dir), "fetch", "origin")
+
+            # Snapshot refs once instead of re-walking them per check
+            ref_names = {ref.name for ref in repo.refs}
+
             # Look for main, master, or develop
             for branch_name in ['main', 'master', 'develop']:
-                if f"origin/{branch_name}" in [ref.name for ref in repo.refs]:
+                if f"origin/{branch_name}" in ref_names:
                     return branch_name
-            
+
             # If none found, use the first remote branch
-            remote_branches = [ref.name.split('/')[-1] for ref in repo.refs if ref.name.startswith('origin/')]
+            remote_branches = [name.split('/')[-1] for name in ref_names if name.startswith('origin/')]
             if remote_branches:
                 return remote_branches[0]
-            
+
             return self.config.git.default_base_branch
-            
+
         except:
             return self.config.git.default_base_branch
\ No newline at end of file
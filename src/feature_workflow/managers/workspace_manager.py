@@ -1,26 +1,134 @@
 """Worktree-based workspace management for feature development."""
 
 import asyncio
-import json
+import fcntl
+import os
 import shutil
+import string
+import tempfile
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
+
+import orjson
+from pydantic import ValidationError
 
 from ..config import FeatureWorkflowConfig
 from ..models.workspace import WorkspaceMetadata, WorkspaceList, WorkspaceStatus, LinearIssue, GitInfo
 from .git_manager import GitManager
 
+# Deletion table stripping everything but [a-z0-9-] from workspace slugs
+_SLUG_ALLOWED = frozenset(string.ascii_lowercase + string.digits + '-')
+_SLUG_TRANS = str.maketrans(
+    '', '', ''.join(chr(i) for i in range(128) if chr(i) not in _SLUG_ALLOWED)
+)
+
+
+class DuplicateWorkspaceError(ValueError):
+    """Raised when creating a workspace whose name is already taken."""
+
+
+class WorkspaceNotFoundError(ValueError):
+    """Raised when an operation references a workspace that does not exist."""
+
+
+class WorkspaceLimitError(ValueError):
+    """Raised when creating a workspace would exceed the worktree limit."""
+
+
+class DeletionResult(NamedTuple):
+    """Outcome of a workspace deletion.
+
+    ``removed`` is whether the workspace (worktree + metadata) was taken
+    down; ``path_removed`` confirms its directory is gone from disk, so
+    callers don't need a follow-up stat.
+    """
+
+    removed: bool
+    path_removed: bool
+
 
 class WorkspaceManager:
     """Manages git worktree-based feature development workspaces."""
     
-    def __init__(self, config: FeatureWorkflowConfig):
+    def __init__(
+        self,
+        config: FeatureWorkflowConfig,
+        git_manager: Optional[GitManager] = None
+    ):
         self.config = config
-        self.git_manager = GitManager(config)
+        # Accept an injected GitManager so callers holding one share its
+        # caches instead of building a second, cold copy
+        self.git_manager = git_manager or GitManager(config)
         self.metadata_dir = config.worktrees_metadata_dir
         self.active_workspace_file = config.active_workspace_file
+        # Parsed metadata keyed by file path, versioned by mtime so edits
+        # on disk invalidate the entry automatically
+        self._meta_cache: dict[Path, tuple[int, WorkspaceMetadata]] = {}
+        # Name-keyed view of the same metadata for zero-stat lookups on the
+        # MCP hot path; written through on save, popped on delete, and
+        # repopulated by list_workspaces. Assumes this process is the only
+        # writer (external edits are still picked up after invalidation)
+        self._ws_cache: dict[str, WorkspaceMetadata] = {}
+        # Names known not to exist, so repeated lookups of bad names don't
+        # each pay a filesystem round trip
+        self._missing: set[str] = set()
+        # Cap concurrent git status subprocesses during list refresh
+        self._status_semaphore = asyncio.Semaphore(8)
+        # Active-pointer content keyed by the pointer file's mtime, so
+        # repeat reads cost one stat instead of a read plus a stat
+        self._active_cache: Optional[tuple[int, str]] = None
+        # Snapshot of the name-keyed cache, reloaded on startup so the
+        # first reads after a process restart skip the per-file loads.
+        # Deliberately not *.json so the workspace scan ignores it
+        self._snapshot_file = self.metadata_dir / ".workspaces.cache"
+        self._seed_from_snapshot()
+        # Lock file serializing workspace writers (reads stay lock-free)
+        self._lock_file = self.metadata_dir / ".workspace.lock"
     
+    def _seed_from_snapshot(self) -> None:
+        """Seed the name-keyed cache from the persisted snapshot, if any.
+
+        Misses still fall through to the per-file metadata, so a stale or
+        partial snapshot only costs the fallback read it was meant to save.
+        """
+        try:
+            entries = orjson.loads(self._snapshot_file.read_bytes())
+            self._ws_cache = {
+                entry['name']: self._parse_metadata(entry) for entry in entries
+            }
+        except (OSError, orjson.JSONDecodeError, ValidationError, KeyError, TypeError):
+            self._ws_cache = {}
+
+    def _persist_snapshot(self) -> None:
+        """Write the name-keyed cache to disk (tmp file + atomic rename)."""
+        payload = orjson.dumps(
+            [metadata.model_dump(mode='json') for metadata in self._ws_cache.values()]
+        )
+        # Unique tmp name per call: saves can run outside the write lock
+        # (background metadata updates, IDE-settings sync), so a shared
+        # tmp file would let concurrent writers race on the rename
+        fd, tmp_name = tempfile.mkstemp(dir=self.metadata_dir, suffix=".cache.tmp")
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(payload)
+        os.replace(tmp_name, self._snapshot_file)
+
+    @asynccontextmanager
+    async def _write_lock(self):
+        """Hold an exclusive flock for the duration of a workspace write.
+
+        Not re-entrant: methods running under the lock must not call other
+        locked methods.
+        """
+        fd = os.open(self._lock_file, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            await asyncio.to_thread(fcntl.flock, fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
     async def create_workspace(
         self,
         issue_id: str,
@@ -37,48 +145,49 @@ class WorkspaceManager:
         workspace_name = self._generate_workspace_name(issue_id, description)
         branch_name = f"feature/{workspace_name}"
         
-        # Check if workspace already exists
-        existing_workspace = await self.get_workspace(workspace_name)
-        if existing_workspace:
-            raise ValueError(f"Workspace {workspace_name} already exists")
-        
-        # Check workspace limit
-        existing_workspaces = await self.list_workspaces()
-        if len(existing_workspaces.workspaces) >= self.config.workspace.max_worktrees:
-            raise ValueError(f"Maximum number of worktrees ({self.config.workspace.max_worktrees}) reached")
-        
-        # Create worktree
-        worktree_path = await self.git_manager.create_worktree_for_feature(
-            repo=repo,
-            feature_name=workspace_name,
-            branch_name=branch_name,
-            base_branch=base_branch
-        )
-        
-        # Create workspace metadata
-        linear_issue = LinearIssue(id=issue_id, title=description)
-        git_info = GitInfo(
-            repo_url=repo.remotes[0].url if repo.remotes else "",
-            base_branch=base_branch,
-            branch_name=branch_name,
-            worktree_path=worktree_path,
-            is_worktree=True
-        )
-        
-        metadata = WorkspaceMetadata(
-            name=workspace_name,
-            path=worktree_path,
-            description=description,
-            issue=linear_issue,
-            git=git_info,
-            main_repo_path=repo_path
-        )
-        
-        # Save metadata
-        await self._save_workspace_metadata(metadata)
-        
-        # Set as active workspace
-        await self.set_active_workspace(workspace_name)
+        async with self._write_lock():
+            # Check if workspace already exists
+            existing_workspace = await self.get_workspace(workspace_name)
+            if existing_workspace:
+                raise DuplicateWorkspaceError(f"Workspace {workspace_name} already exists")
+
+            # Check workspace limit
+            existing_workspaces = await self.list_workspaces()
+            if len(existing_workspaces.workspaces) >= self.config.workspace.max_worktrees:
+                raise WorkspaceLimitError(f"Maximum number of worktrees ({self.config.workspace.max_worktrees}) reached")
+
+            # Create worktree
+            worktree_path = await self.git_manager.create_worktree_for_feature(
+                repo=repo,
+                feature_name=workspace_name,
+                branch_name=branch_name,
+                base_branch=base_branch
+            )
+
+            # Create workspace metadata
+            linear_issue = LinearIssue(id=issue_id, title=description)
+            git_info = GitInfo(
+                repo_url=repo.remotes[0].url if repo.remotes else "",
+                base_branch=base_branch,
+                branch_name=branch_name,
+                worktree_path=worktree_path,
+                is_worktree=True
+            )
+
+            metadata = WorkspaceMetadata(
+                name=workspace_name,
+                path=worktree_path,
+                description=description,
+                issue=linear_issue,
+                git=git_info,
+                main_repo_path=repo_path
+            )
+
+            # Save metadata
+            await self._save_workspace_metadata(metadata)
+
+            # Set as active workspace (we hold the lock, write directly)
+            self._write_active_workspace(workspace_name)
         
         # Sync IDE settings if enabled
         if self.config.workspace.sync_ide_settings:
@@ -90,20 +199,43 @@ class WorkspaceManager:
         """List all workspaces."""
         workspaces = []
         
-        # Scan metadata directory for workspace files
+        # Scan metadata directory for workspace files; scandir gives us the
+        # stat result per entry for free, so the loader can skip its own
         if self.metadata_dir.exists():
-            for metadata_file in self.metadata_dir.glob("*.json"):
-                if metadata_file.name != "config.json":
-                    metadata = await self._load_workspace_metadata(metadata_file)
-                    if metadata:
-                        # Update status from git
-                        try:
-                            git_info = await self.git_manager.get_workspace_status(metadata.path)
-                            metadata.git = git_info
-                        except:
-                            # Workspace might be stale
-                            pass
-                        workspaces.append(metadata)
+            with os.scandir(self.metadata_dir) as it:
+                entries = [
+                    entry for entry in it
+                    if entry.name.endswith(".json")
+                    and entry.name != "config.json"
+                    and entry.is_file()
+                ]
+            if entries:
+                # Each load is independent disk I/O; overlap them instead of
+                # paying sum(latency) across N workspaces
+                loaded = await asyncio.gather(*(
+                    self._load_workspace_metadata(
+                        Path(entry.path), mtime_ns=entry.stat().st_mtime_ns
+                    )
+                    for entry in entries
+                ))
+                workspaces = [metadata for metadata in loaded if metadata]
+                self._ws_cache = {metadata.name: metadata for metadata in workspaces}
+
+        # Update status from git, overlapping the per-workspace calls but
+        # bounding how many git subprocesses run at once
+        if workspaces:
+            async def _status(path: Path) -> GitInfo:
+                async with self._status_semaphore:
+                    return await self.git_manager.get_workspace_status(path)
+
+            statuses = await asyncio.gather(
+                *(_status(w.path) for w in workspaces),
+                return_exceptions=True,
+            )
+            for metadata, git_info in zip(workspaces, statuses):
+                if not isinstance(git_info, BaseException):
+                    metadata.git = git_info
+                # else: workspace might be stale, keep saved info
         
         # Sort by creation time (newest first)
         workspaces.sort(key=lambda w: w.created_at, reverse=True)
@@ -118,41 +250,97 @@ class WorkspaceManager:
     
     async def get_workspace(self, name: str) -> Optional[WorkspaceMetadata]:
         """Get workspace by name."""
+        cached = self._ws_cache.get(name)
+        if cached is not None:
+            return cached
+        if name in self._missing:
+            return None
+
         metadata_file = self.metadata_dir / f"{name}.json"
         if not metadata_file.exists():
+            self._missing.add(name)
             return None
-        
-        return await self._load_workspace_metadata(metadata_file)
+
+        metadata = await self._load_workspace_metadata(metadata_file)
+        if metadata is not None:
+            self._ws_cache[name] = metadata
+        return metadata
+
+    def workspace_exists(self, name: str) -> bool:
+        """Check whether a workspace exists without loading its metadata.
+
+        Answers from the positive/negative caches when possible; a real
+        miss costs one stat on the metadata file.
+        """
+        if name in self._ws_cache:
+            return True
+        if name in self._missing:
+            return False
+        if (self.metadata_dir / f"{name}.json").exists():
+            return True
+        self._missing.add(name)
+        return False
+
+    def invalidate_metadata_cache(self) -> None:
+        """Drop cached metadata so the next read goes back to disk."""
+        self._ws_cache.clear()
+        self._meta_cache.clear()
+        self._missing.clear()
     
     async def set_active_workspace(self, name: str) -> None:
         """Set the active workspace."""
-        # Verify workspace exists
-        workspace = await self.get_workspace(name)
-        if not workspace:
-            raise ValueError(f"Workspace {name} not found")
-        
+        async with self._write_lock():
+            # Verify workspace exists; the cached existence check suffices,
+            # no need to parse and validate the metadata
+            if not self.workspace_exists(name):
+                raise WorkspaceNotFoundError(f"Workspace {name} not found")
+
+            self._write_active_workspace(name)
+
+    def _write_active_workspace(self, name: str) -> None:
+        """Write the active workspace pointer (callers hold the write lock)."""
         # Ensure parent directory exists
         self.active_workspace_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write active workspace file
+
+        # Write active workspace file and refresh the mtime-keyed cache
         self.active_workspace_file.write_text(name)
+        self._active_cache = (os.stat(self.active_workspace_file).st_mtime_ns, name)
     
+    @property
+    def active_workspace_name_sync(self) -> Optional[str]:
+        """Last known active workspace name, served from memory.
+
+        Reflects reads and writes made through this manager without
+        touching disk; use the async accessor when the pointer may have
+        been changed by another process.
+        """
+        return self._active_cache[1] if self._active_cache else None
+
     async def get_active_workspace_name(self) -> Optional[str]:
         """Get the active workspace name."""
-        if not self.active_workspace_file.exists():
+        try:
+            mtime_ns = os.stat(self.active_workspace_file).st_mtime_ns
+        except FileNotFoundError:
+            self._active_cache = None
             return None
-        
+
+        cached = self._active_cache
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
         name = self.active_workspace_file.read_text().strip()
         if not name:
             return None
-        
-        # Verify workspace still exists
-        workspace = await self.get_workspace(name)
-        if not workspace:
+
+        # Verify workspace still exists; a stat on its metadata file is
+        # enough, no need to parse and validate the JSON
+        if not (self.metadata_dir / f"{name}.json").exists():
             # Clean up invalid active workspace
             self.active_workspace_file.unlink(missing_ok=True)
+            self._active_cache = None
             return None
-        
+
+        self._active_cache = (mtime_ns, name)
         return name
     
     async def get_active_workspace(self) -> Optional[WorkspaceMetadata]:
@@ -165,50 +353,116 @@ class WorkspaceManager:
     
     async def update_workspace_metadata(self, metadata: WorkspaceMetadata) -> None:
         """Update workspace metadata."""
-        metadata.update_timestamp()
-        await self._save_workspace_metadata(metadata)
+        async with self._write_lock():
+            # A concurrent delete may have removed this workspace while we
+            # waited for the lock (updates run as background tasks); don't
+            # resurrect its metadata file
+            if metadata.name in self._missing:
+                return
+            metadata.update_timestamp()
+            await self._save_workspace_metadata(metadata)
     
-    async def delete_workspace(self, name: str) -> bool:
-        """Delete a workspace and its worktree."""
-        workspace = await self.get_workspace(name)
-        if not workspace:
-            return False
-        
-        # Get main repository
-        repo = await self.git_manager.ensure_repository(workspace.main_repo_path)
-        
-        # Remove worktree
-        success = await self.git_manager.remove_worktree(repo, workspace.path)
-        
-        # Remove metadata file
-        metadata_file = self.metadata_dir / f"{name}.json"
-        if metadata_file.exists():
-            metadata_file.unlink()
-        
-        # Remove from active workspace if it's currently active
-        active_name = await self.get_active_workspace_name()
-        if active_name == name:
-            self.active_workspace_file.unlink(missing_ok=True)
-        
-        return success
+    async def delete_workspace(self, name: str) -> DeletionResult:
+        """Delete a workspace and its worktree.
+
+        Returns a DeletionResult carrying the final on-disk state, so
+        callers can confirm removal without stat-ing the path themselves.
+        """
+        async with self._write_lock():
+            workspace = await self.get_workspace(name)
+            if not workspace:
+                return DeletionResult(removed=False, path_removed=False)
+
+            # Read the active pointer once up front; after the metadata file
+            # is gone the verifying accessor couldn't resolve it anyway
+            active_name = None
+            if self.active_workspace_file.exists():
+                active_name = self.active_workspace_file.read_text().strip()
+
+            # Get main repository
+            repo = await self.git_manager.ensure_repository(workspace.main_repo_path)
+
+            # Remove worktree
+            success = await self.git_manager.remove_worktree(repo, workspace.path)
+
+            # Remove metadata file (and active pointer if it was ours) in one
+            # thread-offloaded pass
+            metadata_file = self.metadata_dir / f"{name}.json"
+            self._meta_cache.pop(metadata_file, None)
+            self._ws_cache.pop(name, None)
+            self._missing.add(name)
+            if active_name == name:
+                self._active_cache = None
+            await asyncio.to_thread(self._persist_snapshot)
+            await asyncio.to_thread(
+                self._cleanup_workspace_files,
+                metadata_file,
+                self.active_workspace_file if active_name == name else None,
+            )
+
+            return DeletionResult(
+                removed=success,
+                path_removed=not os.path.exists(workspace.path),
+            )
     
-    async def cleanup_old_workspaces(self, days: int = None) -> List[str]:
-        """Clean up old workspaces."""
+    @staticmethod
+    def _cleanup_workspace_files(metadata_file: Path, active_file: Optional[Path]) -> None:
+        """Unlink workspace files without the TOCTOU exists-then-unlink dance."""
+        for path in (metadata_file, active_file):
+            if path is not None:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    async def cleanup_old_workspaces(
+        self,
+        days: int = None,
+        completed_only: bool = False
+    ) -> List[str]:
+        """Clean up old workspaces.
+
+        With ``completed_only`` set, abandoned workspaces are left alone.
+        """
         if days is None:
             days = self.config.workspace.auto_cleanup_days
-        
+
         cutoff_date = datetime.now() - timedelta(days=days)
-        cleaned_workspaces = []
-        
+
+        # Never clean up active workspaces
+        if completed_only:
+            eligible_statuses = (WorkspaceStatus.COMPLETED,)
+        else:
+            eligible_statuses = (WorkspaceStatus.COMPLETED, WorkspaceStatus.ABANDONED)
+
         workspaces = await self.list_workspaces()
-        for workspace in workspaces.workspaces:
-            # Only clean up completed or abandoned workspaces
-            if workspace.status in [WorkspaceStatus.COMPLETED, WorkspaceStatus.ABANDONED]:
-                if workspace.created_at < cutoff_date:
-                    if await self.delete_workspace(workspace.name):
-                        cleaned_workspaces.append(workspace.name)
-        
-        return cleaned_workspaces
+        candidates = [
+            workspace.name
+            for workspace in workspaces.workspaces
+            if workspace.status in eligible_statuses
+            and workspace.created_at < cutoff_date
+        ]
+        if not candidates:
+            return []
+
+        # Deletions are independent; run them concurrently (each one still
+        # takes the write lock internally) but cap how many worktree
+        # removals fork git at once
+        semaphore = asyncio.Semaphore(4)
+
+        async def _remove_one(name: str) -> DeletionResult:
+            async with semaphore:
+                return await self.delete_workspace(name)
+
+        results = await asyncio.gather(
+            *(_remove_one(name) for name in candidates),
+            return_exceptions=True,
+        )
+
+        return [
+            name for name, result in zip(candidates, results)
+            if isinstance(result, DeletionResult) and result.removed
+        ]
     
     async def sync_workspace(
         self, 
@@ -218,7 +472,7 @@ class WorkspaceManager:
         """Sync workspace with base branch."""
         workspace = await self.get_workspace(name)
         if not workspace:
-            raise ValueError(f"Workspace {name} not found")
+            raise WorkspaceNotFoundError(f"Workspace {name} not found")
         
         return await self.git_manager.sync_worktree_with_base(
             workspace.path, 
@@ -226,74 +480,163 @@ class WorkspaceManager:
             strategy
         )
     
-    def _generate_workspace_name(self, issue_id: str, description: str) -> str:
+    @staticmethod
+    def _generate_workspace_name(issue_id: str, description: str) -> str:
         """Generate a workspace name from issue ID and description."""
-        # Clean up description for use in filename
-        clean_description = description.lower().replace(' ', '-')
-        # Remove non-alphanumeric characters except hyphens
-        clean_description = ''.join(c for c in clean_description if c.isalnum() or c == '-')
-        # Limit length
-        clean_description = clean_description[:30]
+        # Clean up description for use in filename: lowercase, hyphenate,
+        # strip everything else via a C-level translate pass, limit length
+        clean_description = (
+            description.lower().replace(' ', '-')
+            .translate(_SLUG_TRANS)
+            .encode('ascii', 'ignore').decode('ascii')[:30]
+        )
         
         # Combine issue ID and description
         return f"{issue_id.lower()}-{clean_description}"
     
     async def _save_workspace_metadata(self, metadata: WorkspaceMetadata) -> None:
         """Save workspace metadata to file."""
-        # Ensure metadata directory exists
-        self.metadata_dir.mkdir(parents=True, exist_ok=True)
-        
+        # metadata_dir comes from the cached config accessor, which already
+        # created it; no need to re-mkdir on every save
         metadata_file = self.metadata_dir / f"{metadata.name}.json"
         
         # Convert to dict for JSON serialization
         metadata_dict = metadata.model_dump(mode='json')
-        
-        # Write to file
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata_dict, f, indent=2, default=str)
+
+        # Single buffer, written off-loop to a temp file and renamed into
+        # place so concurrent readers never see a partial file
+        payload = orjson.dumps(metadata_dict, option=orjson.OPT_INDENT_2)
+
+        def _write() -> None:
+            # Unique tmp name per call: the IDE-settings save runs outside
+            # the write lock, so a fixed tmp path could race on the rename
+            fd, tmp_name = tempfile.mkstemp(dir=self.metadata_dir, suffix=".json.tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(payload)
+            os.replace(tmp_name, metadata_file)
+
+        await asyncio.to_thread(_write)
+
+        # Refresh cache entries with the new state
+        self._meta_cache[metadata_file] = (metadata_file.stat().st_mtime_ns, metadata)
+        self._ws_cache[metadata.name] = metadata
+        self._missing.discard(metadata.name)
+        await asyncio.to_thread(self._persist_snapshot)
     
-    async def _load_workspace_metadata(self, metadata_file: Path) -> Optional[WorkspaceMetadata]:
-        """Load workspace metadata from file."""
-        if not metadata_file.exists():
-            return None
-        
+    async def _load_workspace_metadata(
+        self,
+        metadata_file: Path,
+        mtime_ns: Optional[int] = None
+    ) -> Optional[WorkspaceMetadata]:
+        """Load workspace metadata from file.
+
+        Callers that already hold a stat result (e.g. from os.scandir) can
+        pass mtime_ns to avoid a second stat syscall.
+        """
+        if mtime_ns is None:
+            try:
+                mtime_ns = metadata_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._meta_cache.pop(metadata_file, None)
+                return None
+
+        cached = self._meta_cache.get(metadata_file)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
-            with open(metadata_file, 'r') as f:
-                metadata_dict = json.load(f)
-            
-            # Convert path objects back to Path instances
-            metadata_dict['path'] = Path(metadata_dict['path'])
-            metadata_dict['main_repo_path'] = Path(metadata_dict['main_repo_path'])
-            metadata_dict['git']['worktree_path'] = Path(metadata_dict['git']['worktree_path'])
-            
-            return WorkspaceMetadata.model_validate(metadata_dict)
-        except (json.JSONDecodeError, Exception):
-            # If metadata is corrupted, return None
+            raw = await asyncio.to_thread(metadata_file.read_bytes)
+            metadata = self._parse_metadata(orjson.loads(raw))
+            self._meta_cache[metadata_file] = (mtime_ns, metadata)
+            return metadata
+        except (OSError, orjson.JSONDecodeError, ValidationError):
+            # If metadata is missing or corrupted, return None
             return None
     
+    @staticmethod
+    def _parse_metadata(metadata_dict: dict) -> WorkspaceMetadata:
+        """Build a WorkspaceMetadata from a loaded dict.
+
+        Metadata files are our own round-trip output, so for the current
+        schema version we reconstruct with model_construct and coerce only
+        the non-string fields, skipping the full validator pass. Anything
+        unexpected falls back to model_validate.
+        """
+        try:
+            if metadata_dict.get('version') == '2.0':
+                git_dict = metadata_dict['git']
+                return WorkspaceMetadata.model_construct(
+                    version=metadata_dict['version'],
+                    created_at=datetime.fromisoformat(metadata_dict['created_at']),
+                    updated_at=datetime.fromisoformat(metadata_dict['updated_at']),
+                    name=metadata_dict['name'],
+                    path=Path(metadata_dict['path']),
+                    description=metadata_dict['description'],
+                    status=WorkspaceStatus(metadata_dict['status']),
+                    issue=LinearIssue.model_construct(**metadata_dict['issue']),
+                    git=GitInfo.model_construct(
+                        **{**git_dict, 'worktree_path': Path(git_dict['worktree_path'])}
+                    ),
+                    main_repo_path=Path(metadata_dict['main_repo_path']),
+                    commits=metadata_dict.get('commits', []),
+                    settings_synced=metadata_dict.get('settings_synced', False),
+                    ide_configs_copied=metadata_dict.get('ide_configs_copied', []),
+                )
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        # Unknown version or drifted schema: validate properly
+        return WorkspaceMetadata.model_validate(metadata_dict)
+
     async def _sync_ide_settings(
-        self, 
-        repo_path: Path, 
-        worktree_path: Path, 
+        self,
+        repo_path: Path,
+        worktree_path: Path,
         metadata: WorkspaceMetadata
     ) -> None:
         """Sync IDE settings from main repo to worktree."""
-        copied_configs = []
-        
-        for config_dir in self.config.workspace.ide_config_dirs:
-            source_dir = repo_path / config_dir
-            target_dir = worktree_path / config_dir
-            
-            if source_dir.exists() and source_dir.is_dir():
-                try:
-                    # Copy the entire configuration directory
-                    shutil.copytree(source_dir, target_dir, dirs_exist_ok=True)
-                    copied_configs.append(config_dir)
-                except Exception:
-                    # If copy fails, continue with other configs
-                    pass
-        
+        # Copy the config dirs concurrently in threads so the blocking
+        # copytree calls overlap and don't stall the event loop
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._copy_ide_config,
+                    repo_path / config_dir,
+                    worktree_path / config_dir,
+                    config_dir,
+                )
+                for config_dir in self.config.workspace.ide_config_dirs
+            ),
+            return_exceptions=True,
+        )
+
+        # Failed copies surface as exceptions/None; keep the rest
+        copied_configs = [r for r in results if isinstance(r, str)]
+
         # Update metadata
         metadata.settings_synced = True
         metadata.ide_configs_copied = copied_configs
-        await self._save_workspace_metadata(metadata)
\ No newline at end of file
+        await self._save_workspace_metadata(metadata)
+
+    def _copy_ide_config(
+        self,
+        source_dir: Path,
+        target_dir: Path,
+        config_dir: str
+    ) -> Optional[str]:
+        """Copy one IDE config directory, returning its name on success."""
+        if not (source_dir.exists() and source_dir.is_dir()):
+            return None
+
+        try:
+            # Hardlink instead of byte-copying; config files are
+            # read-mostly so sharing inodes with the main repo is fine
+            shutil.copytree(
+                source_dir, target_dir,
+                dirs_exist_ok=True, copy_function=os.link
+            )
+        except OSError:
+            # Cross-device link or unsupported filesystem
+            shutil.copytree(source_dir, target_dir, dirs_exist_ok=True)
+
+        return config_dir
\ No newline at end of file
@@ -1,6 +1,5 @@
 """Workspace management for feature development."""
 
-import asyncio
 import json
 import shutil
 from datetime import datetime, timedelta
@@ -1,15 +1,16 @@
 """Git worktree operations manager for feature development."""
 
 import asyncio
+import os
 import shutil
 from pathlib import Path
-from typing import List, Tuple, Optional
+from uuid import uuid4
+from typing import List, Tuple
 
-import git
 from git import Repo, GitCommandError
 
 from ..config import FeatureWorkflowConfig
-from ..models.workspace import WorkspaceMetadata, GitInfo
+from ..models.workspace import GitInfo
 
 
 class WorktreeManager:
@@ -17,7 +18,37 @@ class WorktreeManager:
     
     def __init__(self, config: FeatureWorkflowConfig):
         self.config = config
-    
+        # Repo objects reused across status/sync calls; construction parses
+        # config and scans refs, which is pure overhead on repeat polls
+        self._repo_cache: dict[Path, Repo] = {}
+        # Ahead/behind counts keyed by the (HEAD, origin/base) SHA pair they
+        # were computed from; the counts only move when a ref moves, so a
+        # cheap rev-parse replaces the rev-list graph walk on repeat polls
+        self._ahead_behind_cache: dict[Path, Tuple[str, Tuple[int, int]]] = {}
+        # Strong references to background cleanup tasks so they aren't
+        # garbage-collected before the rmtree runs
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def _repo_for(self, worktree_path: Path) -> Repo:
+        """Get a (cached) Repo for a worktree path."""
+        repo = self._repo_cache.get(worktree_path)
+        if repo is None:
+            repo = await asyncio.to_thread(Repo, worktree_path)
+            self._repo_cache[worktree_path] = repo
+        return repo
+
+    async def _run_git(self, working_dir: Path, *args: str) -> str:
+        """Run a git command via async subprocess without blocking the loop."""
+        proc = await asyncio.create_subprocess_exec(
+            "git", "-C", str(working_dir), *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise GitCommandError(["git", *args], proc.returncode, stderr.decode())
+        return stdout.decode().strip()
+
     async def create_worktree(
         self,
         repo: Repo,
@@ -32,8 +63,13 @@ class WorktreeManager:
             worktrees_dir = self.config.get_worktree_dir(repo_path)
             worktree_path = worktrees_dir / worktree_name
             
-            # Check if worktree already exists
+            # Check if worktree already exists; an orphaned worktree (still
+            # registered with git but with no workspace tracking it) can be
+            # repointed at the new branch instead of erroring out, skipping
+            # the checkout copy a fresh 'worktree add' would pay
             if worktree_path.exists():
+                if await self._try_reuse_worktree(repo, worktree_path, branch_name, base_branch):
+                    return worktree_path
                 raise ValueError(f"Worktree {worktree_name} already exists")
             
             # Create new branch if it doesn't exist
@@ -50,64 +86,170 @@ class WorktreeManager:
             else:
                 # Create worktree from existing branch
                 repo.git.worktree("add", str(worktree_path), branch_name)
-            
+
+            # Worktrees share the main object store for free, but submodules
+            # would clone from scratch; initialize them against the main
+            # checkout's module store instead
+            await self._init_submodules(repo, worktree_path)
+
             return worktree_path
-            
+
         except GitCommandError as e:
             raise ValueError(f"Failed to create worktree: {e}")
+
+    async def _try_reuse_worktree(
+        self,
+        repo: Repo,
+        worktree_path: Path,
+        branch_name: str,
+        base_branch: str
+    ) -> bool:
+        """Repoint an existing registered worktree at a new feature branch.
+
+        Returns False when the path isn't a worktree of this repository or
+        the switch fails, so the caller can surface its usual error.
+        """
+        registered = await asyncio.to_thread(self._read_worktrees, repo)
+        if worktree_path not in (path for path, _, is_main in registered if not is_main):
+            return False
+
+        try:
+            if branch_name in {head.name for head in repo.heads}:
+                await self._run_git(worktree_path, "switch", branch_name)
+            else:
+                ref_names = {ref.name for ref in repo.refs}
+                base_ref = (
+                    f"origin/{base_branch}"
+                    if f"origin/{base_branch}" in ref_names else base_branch
+                )
+                await self._run_git(
+                    worktree_path, "switch", "-c", branch_name, base_ref
+                )
+            return True
+        except GitCommandError:
+            return False
+
+    async def _init_submodules(self, repo: Repo, worktree_path: Path) -> None:
+        """Initialize worktree submodules, sharing objects with the main repo.
+
+        Passing ``--reference`` at the main checkout's module store turns
+        each submodule init into a local object link instead of a network
+        clone. Failures fall back to a plain init; submodule trouble should
+        not abort worktree creation.
+        """
+        if not (worktree_path / ".gitmodules").exists():
+            return
+
+        try:
+            out = await self._run_git(
+                worktree_path, "config", "-f", ".gitmodules",
+                "--get-regexp", r"submodule\..*\.path"
+            )
+        except GitCommandError:
+            return
+
+        modules_dir = Path(repo.git_dir) / "modules"
+        for line in out.splitlines():
+            sub_path = line.split(" ", 1)[1]
+            reference = modules_dir / sub_path
+            try:
+                if reference.is_dir():
+                    await self._run_git(
+                        worktree_path, "submodule", "update", "--init",
+                        "--reference", str(reference), "--", sub_path
+                    )
+                else:
+                    await self._run_git(
+                        worktree_path, "submodule", "update", "--init", "--", sub_path
+                    )
+            except GitCommandError:
+                continue
     
     async def remove_worktree(self, repo: Repo, worktree_path: Path) -> bool:
         """Remove a git worktree."""
+        self._repo_cache.pop(worktree_path, None)
+        self._ahead_behind_cache.pop(worktree_path, None)
+        if not worktree_path.exists():
+            return False
+
         try:
-            if not worktree_path.exists():
-                return False
-            
             # Remove worktree from git
             repo.git.worktree("remove", str(worktree_path), "--force")
-            
-            # Clean up any remaining directory
-            if worktree_path.exists():
-                shutil.rmtree(worktree_path)
-            
-            return True
-            
-        except GitCommandError as e:
-            # If git command fails, try manual cleanup
-            if worktree_path.exists():
-                shutil.rmtree(worktree_path)
-            return True
+        except GitCommandError:
+            # If git command fails, fall through to manual cleanup
+            pass
+
+        # If the directory survived, rename it into a hidden trash dir
+        # (atomic on the same filesystem) and reclaim inodes in the
+        # background so the caller doesn't wait on a full tree walk
+        if worktree_path.exists():
+            trash_dir = worktree_path.parent / ".trash"
+            trashed = trash_dir / f"{worktree_path.name}-{uuid4().hex}"
+            try:
+                trash_dir.mkdir(exist_ok=True)
+                os.rename(worktree_path, trashed)
+            except OSError:
+                # Cross-device or permission issue: delete in place
+                await asyncio.to_thread(shutil.rmtree, worktree_path, True)
+            else:
+                task = asyncio.create_task(
+                    asyncio.to_thread(shutil.rmtree, trashed, True)
+                )
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+        return True
     
     async def list_worktrees(self, repo: Repo) -> List[Tuple[Path, str, bool]]:
-        """List all git worktrees for the repository."""
+        """List all git worktrees for the repository.
+
+        Reads ``.git/worktrees/`` directly instead of forking
+        ``git worktree list``; the gitdir/HEAD files carry the same data.
+        """
+        return await asyncio.to_thread(self._read_worktrees, repo)
+
+    @staticmethod
+    def _read_worktrees(repo: Repo) -> List[Tuple[Path, str, bool]]:
+        """Collect (path, branch, is_main) tuples from the git dir."""
+        worktrees: List[Tuple[Path, str, bool]] = []
+        git_dir = Path(repo.git_dir)
+
+        # Main worktree first
+        if repo.working_dir:
+            worktrees.append((
+                Path(repo.working_dir),
+                WorktreeManager._read_head_branch(git_dir / 'HEAD'),
+                True,
+            ))
+
+        worktrees_dir = git_dir / 'worktrees'
+        if worktrees_dir.is_dir():
+            with os.scandir(worktrees_dir) as it:
+                entries = [entry for entry in it if entry.is_dir()]
+            for entry in entries:
+                try:
+                    gitdir = Path(entry.path, 'gitdir').read_text().strip()
+                except OSError:
+                    # Stale/pruned worktree entry
+                    continue
+                worktrees.append((
+                    Path(gitdir).parent,
+                    WorktreeManager._read_head_branch(Path(entry.path) / 'HEAD'),
+                    False,
+                ))
+
+        return worktrees
+
+    @staticmethod
+    def _read_head_branch(head_file: Path) -> str:
+        """Resolve a HEAD file to a branch name ('HEAD' when detached)."""
         try:
-            # Get worktree list from git
-            worktree_output = repo.git.worktree("list", "--porcelain")
-            
-            worktrees = []
-            current_worktree = {}
-            
-            for line in worktree_output.split('\n'):
-                if line.startswith('worktree '):
-                    if current_worktree:
-                        worktrees.append(self._parse_worktree_info(current_worktree))
-                    current_worktree = {'path': line.split(' ', 1)[1]}
-                elif line.startswith('HEAD '):
-                    current_worktree['head'] = line.split(' ', 1)[1]
-                elif line.startswith('branch '):
-                    current_worktree['branch'] = line.split(' ', 1)[1]
-                elif line == 'bare':
-                    current_worktree['bare'] = True
-                elif line == 'detached':
-                    current_worktree['detached'] = True
-            
-            # Don't forget the last worktree
-            if current_worktree:
-                worktrees.append(self._parse_worktree_info(current_worktree))
-            
-            return worktrees
-            
-        except GitCommandError:
-            return []
+            head = head_file.read_text().strip()
+        except OSError:
+            return 'HEAD'
+        if head.startswith('ref: '):
+            return head[5:].removeprefix('refs/heads/')
+        return 'HEAD'
     
     async def prune_worktrees(self, repo: Repo) -> List[str]:
         """Prune stale worktree references."""
@@ -129,36 +271,46 @@ class WorktreeManager:
     async def get_worktree_status(self, worktree_path: Path) -> GitInfo:
         """Get git status for a specific worktree."""
         try:
-            worktree_repo = Repo(worktree_path)
-            
-            # Get basic info
-            current_branch = worktree_repo.active_branch.name
-            
+            worktree_repo = await self._repo_for(worktree_path)
+
             # Get remote info
             remote_url = ""
             if worktree_repo.remotes:
                 remote_url = worktree_repo.remotes[0].url
-            
-            # Get file status
-            modified_files = len([item.a_path for item in worktree_repo.index.diff(None)])
-            staged_files = len([item.a_path for item in worktree_repo.index.diff("HEAD")])
-            
-            # Get commits ahead/behind base branch
-            commits_ahead = 0
-            commits_behind = 0
-            
-            try:
-                base_branch = self.config.git.default_base_branch
-                if f"origin/{base_branch}" in [ref.name for ref in worktree_repo.refs]:
-                    ahead_behind = worktree_repo.git.rev_list(
-                        "--left-right", "--count", 
-                        f"origin/{base_branch}...{current_branch}"
-                    ).split('\t')
-                    commits_behind = int(ahead_behind[0])
-                    commits_ahead = int(ahead_behind[1])
-            except:
-                pass
-            
+
+            base_branch = self.config.git.default_base_branch
+
+            async def _count_ahead_behind() -> Tuple[int, int]:
+                try:
+                    shas = await self._run_git(
+                        worktree_path, "rev-parse", "HEAD", f"origin/{base_branch}"
+                    )
+                    cached = self._ahead_behind_cache.get(worktree_path)
+                    if cached and cached[0] == shas:
+                        return cached[1]
+
+                    out = await self._run_git(
+                        worktree_path, "rev-list", "--left-right", "--count",
+                        f"origin/{base_branch}...HEAD"
+                    )
+                    behind, ahead = map(int, out.split())
+                    self._ahead_behind_cache[worktree_path] = (shas, (ahead, behind))
+                    return ahead, behind
+                except (GitCommandError, ValueError):
+                    # No origin/<base> ref to compare against
+                    return 0, 0
+
+            # One porcelain-v2 call replaces the branch lookup plus the two
+            # diff subprocesses; ahead/behind stays a separate rev-list
+            # because branch.ab compares against the branch upstream, not
+            # the configured base branch
+            (commits_ahead, commits_behind), (current_branch, modified_files, staged_files) = (
+                await asyncio.gather(
+                    _count_ahead_behind(),
+                    self._read_status_porcelain(worktree_path),
+                )
+            )
+
             return GitInfo(
                 repo_url=remote_url,
                 base_branch=self.config.git.default_base_branch,
@@ -173,7 +325,34 @@ class WorktreeManager:
             
         except Exception as e:
             raise ValueError(f"Failed to get worktree status: {e}")
-    
+
+    async def _read_status_porcelain(self, worktree_path: Path) -> Tuple[str, int, int]:
+        """Get (branch, modified, staged) from one git status invocation.
+
+        ``--porcelain=v2 --branch`` reports the branch head and per-file
+        staged/unstaged state in a single subprocess.
+        """
+        out = await self._run_git(
+            worktree_path, "status", "--porcelain=v2", "--branch"
+        )
+        branch = "HEAD"
+        modified = 0
+        staged = 0
+        for line in out.splitlines():
+            if line.startswith(("1 ", "2 ")):
+                # Format: "<kind> <XY> ..." where X is the staged state and
+                # Y the worktree state; '.' means unchanged on that side
+                xy = line.split(" ", 2)[1]
+                if xy[0] != ".":
+                    staged += 1
+                if xy[1] != ".":
+                    modified += 1
+            elif line.startswith("# branch.head "):
+                head = line[len("# branch.head "):]
+                if head != "(detached)":
+                    branch = head
+        return branch, modified, staged
+
     async def sync_worktree_with_base(
         self, 
         worktree_path: Path, 
@@ -182,22 +361,14 @@ class WorktreeManager:
     ) -> Tuple[int, int, bool]:
         """Sync worktree with base branch."""
         try:
-            worktree_repo = Repo(worktree_path)
-            
+            worktree_repo = await self._repo_for(worktree_path)
+
             # Fetch latest changes
             worktree_repo.remote('origin').fetch()
             
             # Get current state
             current_branch = worktree_repo.active_branch.name
-            
-            # Count commits before sync
-            ahead_behind_before = worktree_repo.git.rev_list(
-                "--left-right", "--count", 
-                f"origin/{base_branch}...{current_branch}"
-            ).split('\t')
-            commits_behind_before = int(ahead_behind_before[0])
-            commits_ahead_before = int(ahead_behind_before[1])
-            
+
             # Perform sync based on strategy
             has_conflicts = False
             if strategy == "rebase":
@@ -217,43 +388,30 @@ class WorktreeManager:
                     else:
                         raise
             
-            # Get new state (only if no conflicts)
-            commits_ahead_after = commits_ahead_before
+            # Get new state (only if no conflicts; callers only consume the
+            # post-sync counts, so the pre-sync walk was pure overhead)
+            commits_ahead_after = 0
             commits_behind_after = 0
-            
+
             if not has_conflicts:
-                ahead_behind_after = worktree_repo.git.rev_list(
-                    "--left-right", "--count", 
+                ahead_behind_after = (await self._run_git(
+                    worktree_path, "rev-list", "--left-right", "--count",
                     f"origin/{base_branch}...{current_branch}"
-                ).split('\t')
+                )).split('\t')
                 commits_behind_after = int(ahead_behind_after[0])
                 commits_ahead_after = int(ahead_behind_after[1])
-            
+
             return commits_ahead_after, commits_behind_after, has_conflicts
             
         except Exception as e:
             raise ValueError(f"Failed to sync worktree: {e}")
     
-    def _parse_worktree_info(self, worktree_data: dict) -> Tuple[Path, str, bool]:
-        """Parse worktree information from git worktree list output."""
-        path = Path(worktree_data['path'])
-        branch = worktree_data.get('branch', 'HEAD')
-        is_main = 'bare' in worktree_data or branch == 'refs/heads/main'
-        
-        # Clean up branch name
-        if branch.startswith('refs/heads/'):
-            branch = branch[11:]  # Remove 'refs/heads/' prefix
-        
-        return path, branch, is_main
-    
     async def is_worktree(self, path: Path) -> bool:
         """Check if a directory is a git worktree."""
+        # Worktrees have a .git *file* pointing into the main repo's
+        # .git/worktrees dir; no need to construct a full Repo to see that
+        git_file = path / ".git"
         try:
-            repo = Repo(path)
-            git_dir = Path(repo.git_dir)
-            
-            # Worktrees have a .git file pointing to the worktree, not a .git directory
-            git_file = path / ".git"
-            return git_file.is_file() and "worktrees" in git_file.read_text()
-        except:
+            return git_file.is_file() and b"worktrees" in git_file.read_bytes()
+        except OSError:
             return False
\ No newline at end of file
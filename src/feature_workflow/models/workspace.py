@@ -2,10 +2,11 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class WorkspaceStatus(str, Enum):
@@ -16,19 +17,26 @@ class WorkspaceStatus(str, Enum):
     ABANDONED = "abandoned"
 
 
+# Accepted Linear issue ID prefixes (hoisted so the validator checks the
+# already-uppercased value once instead of uppercasing twice per model)
+_ISSUE_ID_PREFIXES = ("AIM-", "FEAT-", "BUG-", "TASK-")
+
+
 class LinearIssue(BaseModel):
     """Linear issue information."""
-    
+
     id: str = Field(..., description="Linear issue ID (e.g., AIM-123)")
     title: Optional[str] = Field(None, description="Issue title")
     description: Optional[str] = Field(None, description="Issue description")
-    
-    @validator("id")
+
+    @field_validator("id")
+    @classmethod
     def validate_issue_id(cls, v):
         """Validate Linear issue ID format."""
-        if not v.upper().startswith(("AIM-", "FEAT-", "BUG-", "TASK-")):
+        v = v.upper()
+        if not v.startswith(_ISSUE_ID_PREFIXES):
             raise ValueError("Issue ID must start with AIM-, FEAT-, BUG-, or TASK-")
-        return v.upper()
+        return v
 
 
 class GitInfo(BaseModel):
@@ -97,37 +105,76 @@ class WorkspaceMetadata(BaseModel):
         """Get the Linear issue ID."""
         return self.issue.id
 
+    @cached_property
+    def path_str(self) -> str:
+        """String form of the worktree path, materialized once."""
+        return str(self.path)
+
+    @cached_property
+    def main_repo_path_str(self) -> str:
+        """String form of the main repository path, materialized once."""
+        return str(self.main_repo_path)
+
+    def to_summary_dict(self) -> dict:
+        """Build the flat summary dict the list tooling reports."""
+        git = self.git
+        return {
+            "name": self.name,
+            "path": self.path_str,
+            "branch": git.branch_name,
+            "issue_id": self.issue.id,
+            "description": self.description,
+            "commits_ahead": git.commits_ahead,
+            "commits_behind": git.commits_behind,
+            "modified_files": git.modified_files,
+            "staged_files": git.staged_files,
+            "last_commit": self.updated_at.isoformat(),
+            "status": self.status.value,
+            "is_worktree": git.is_worktree,
+            "main_repo_path": self.main_repo_path_str,
+            "settings_synced": self.settings_synced,
+        }
+
 
 class WorkspaceList(BaseModel):
     """List of workspaces with metadata."""
     
     workspaces: list[WorkspaceMetadata] = Field(default_factory=list)
     active_workspace: Optional[str] = Field(None, description="Currently active workspace name")
-    
+
+    # Lazily-built name index so lookups/mutations are O(1) instead of
+    # scanning the list; kept in sync by the mutators below
+    _by_name: Optional[dict] = PrivateAttr(default=None)
+
+    def _index(self) -> dict:
+        """Get the name -> workspace index, building it on first use."""
+        if self._by_name is None:
+            self._by_name = {ws.name: ws for ws in self.workspaces}
+        return self._by_name
+
     def get_active_workspace(self) -> Optional[WorkspaceMetadata]:
         """Get the currently active workspace."""
         if not self.active_workspace:
             return None
-        return next(
-            (ws for ws in self.workspaces if ws.name == self.active_workspace),
-            None
-        )
-    
+        return self._index().get(self.active_workspace)
+
     def get_workspace_by_name(self, name: str) -> Optional[WorkspaceMetadata]:
         """Get workspace by name."""
-        return next(
-            (ws for ws in self.workspaces if ws.name == name),
-            None
-        )
-    
+        return self._index().get(name)
+
     def add_workspace(self, workspace: WorkspaceMetadata) -> None:
         """Add a workspace to the list."""
-        # Remove existing workspace with same name
-        self.workspaces = [ws for ws in self.workspaces if ws.name != workspace.name]
-        self.workspaces.append(workspace)
-    
+        index = self._index()
+        # Re-adding moves the workspace to the end, as before
+        index.pop(workspace.name, None)
+        index[workspace.name] = workspace
+        self.workspaces = list(index.values())
+
     def remove_workspace(self, name: str) -> bool:
         """Remove a workspace by name."""
-        original_count = len(self.workspaces)
-        self.workspaces = [ws for ws in self.workspaces if ws.name != name]
-        return len(self.workspaces) < original_count
\ No newline at end of file
+        index = self._index()
+        if name not in index:
+            return False
+        del index[name]
+        self.workspaces = list(index.values())
+        return True
\ No newline at end of file
@@ -1,24 +1,62 @@
 """Main MCP server for feature workflow automation."""
 
 import asyncio
-import json
-from typing import Any, Dict, List, Optional
+import logging
+import os
+from typing import Any, Dict, Optional
+
+import orjson
+from git import GitCommandError
 
 from mcp.server.fastmcp import FastMCP
 
 from .config import config
 from .managers.workspace_manager import WorkspaceManager
 from .managers.git_manager import GitManager
-from .models.workspace import WorkspaceMetadata
+
+# Cap git-heavy tool calls so a burst of MCP requests can't fork an
+# unbounded number of git subprocesses at once
+_GIT_SEMAPHORE = asyncio.Semaphore(max(4, os.cpu_count() or 4))
+
+logger = logging.getLogger(__name__)
 
 
 class FeatureWorkflowServer:
     """MCP server for feature workflow automation."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        workspace_manager: Optional[WorkspaceManager] = None,
+        git_manager: Optional[GitManager] = None
+    ):
         self.config = config
-        self.workspace_manager = WorkspaceManager(config)
-        self.git_manager = GitManager(config)
+        # Managers are injectable (tests, alternative entrypoints) and the
+        # git manager defaults to the workspace manager's own instance, so
+        # both views share one set of Repo/status caches
+        self.workspace_manager = workspace_manager or WorkspaceManager(
+            config, git_manager=git_manager
+        )
+        self.git_manager = git_manager or self.workspace_manager.git_manager
+        # Bound once; the pydantic attribute chain doesn't change after
+        # startup and this sits on the per-call path
+        self._default_base = config.git.default_base_branch
+        # Strong references to fire-and-forget tasks so they aren't
+        # garbage-collected mid-flight
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def _spawn_background(self, coro) -> None:
+        """Run a coroutine in the background, logging any exception."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+
+        def _done(t: asyncio.Task) -> None:
+            self._background_tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                logger.error(
+                    "Background task failed", exc_info=t.exception()
+                )
+
+        task.add_done_callback(_done)
     
     async def start_feature(
         self,
@@ -34,7 +72,7 @@ class FeatureWorkflowServer:
             
             # Use default base branch if not provided
             if not base_branch:
-                base_branch = self.config.git.default_base_branch
+                base_branch = self._default_base
             
             # Create worktree-based workspace
             workspace = await self.workspace_manager.create_workspace(
@@ -45,16 +83,16 @@ class FeatureWorkflowServer:
             
             return {
                 "success": True,
-                "workspace_path": str(workspace.path),
+                "workspace_path": workspace.path_str,
                 "branch_name": workspace.branch_name,
                 "issue_id": workspace.issue_id,
                 "description": workspace.description,
-                "main_repo_path": str(workspace.main_repo_path),
+                "main_repo_path": workspace.main_repo_path_str,
                 "settings_synced": workspace.settings_synced,
                 "ide_configs_copied": workspace.ide_configs_copied
             }
             
-        except Exception as e:
+        except (ValueError, GitCommandError, OSError) as e:
             return {
                 "success": False,
                 "error": str(e)
@@ -62,40 +100,28 @@ class FeatureWorkflowServer:
     
     async def list_features(self) -> Dict[str, Any]:
         """List all feature workspaces."""
-        try:
-            workspace_list = await self.workspace_manager.list_workspaces()
+        async with _GIT_SEMAPHORE:
+            try:
+                workspace_list = await self.workspace_manager.list_workspaces()
             
-            workspaces_data = []
-            for workspace in workspace_list.workspaces:
-                workspaces_data.append({
-                    "name": workspace.name,
-                    "path": str(workspace.path),
-                    "branch": workspace.branch_name,
-                    "issue_id": workspace.issue_id,
-                    "description": workspace.description,
-                    "commits_ahead": workspace.git.commits_ahead,
-                    "commits_behind": workspace.git.commits_behind,
-                    "modified_files": workspace.git.modified_files,
-                    "staged_files": workspace.git.staged_files,
-                    "last_commit": workspace.updated_at.isoformat(),
-                    "is_active": workspace.name == workspace_list.active_workspace,
-                    "status": workspace.status.value,
-                    "is_worktree": workspace.git.is_worktree,
-                    "main_repo_path": str(workspace.main_repo_path),
-                    "settings_synced": workspace.settings_synced
-                })
+                active_name = workspace_list.active_workspace
+                workspaces_data = []
+                for workspace in workspace_list.workspaces:
+                    entry = workspace.to_summary_dict()
+                    entry["is_active"] = workspace.name == active_name
+                    workspaces_data.append(entry)
             
-            return {
-                "success": True,
-                "workspaces": workspaces_data,
-                "active_workspace": workspace_list.active_workspace
-            }
+                return {
+                    "success": True,
+                    "workspaces": workspaces_data,
+                    "active_workspace": workspace_list.active_workspace
+                }
             
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            except (ValueError, GitCommandError, OSError) as e:
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
     
     async def switch_feature(self, workspace_name: str) -> Dict[str, Any]:
         """Switch to a different feature workspace."""
@@ -111,12 +137,12 @@ class FeatureWorkflowServer:
             return {
                 "success": True,
                 "workspace_name": workspace_name,
-                "workspace_path": str(workspace.path),
+                "workspace_path": workspace.path_str,
                 "branch_name": workspace.branch_name,
                 "issue_id": workspace.issue_id
             }
             
-        except Exception as e:
+        except (ValueError, GitCommandError, OSError) as e:
             return {
                 "success": False,
                 "error": str(e)
@@ -128,90 +154,144 @@ class FeatureWorkflowServer:
         close_issue: bool = False
     ) -> Dict[str, Any]:
         """Commit changes in the active workspace."""
-        try:
-            # Get active workspace
-            workspace = await self.workspace_manager.get_active_workspace()
-            if not workspace:
-                raise ValueError("No active workspace found")
+        async with _GIT_SEMAPHORE:
+            try:
+                # Get active workspace
+                workspace = await self.workspace_manager.get_active_workspace()
+                if not workspace:
+                    raise ValueError("No active workspace found")
             
-            # Validate git repository
-            if not await self.git_manager.is_git_repository(workspace.path):
-                raise ValueError("Active workspace is not a git repository")
+                # Load git repository (cached on the manager across calls);
+                # opening it doubles as the is-it-a-repo check, so no separate
+                # probe is needed
+                try:
+                    repo = await self.git_manager.get_repo(workspace.path)
+                except ValueError:
+                    raise ValueError("Active workspace is not a git repository")
             
-            # Load git repository
-            from git import Repo
-            repo = Repo(workspace.path)
+                # Commit changes
+                commit_hash = await self.git_manager.commit_changes(
+                    repo=repo,
+                    message=message,
+                    issue_id=workspace.issue_id,
+                    is_closing=close_issue
+                )
             
-            # Commit changes
-            commit_hash = await self.git_manager.commit_changes(
-                repo=repo,
-                message=message,
-                issue_id=workspace.issue_id,
-                is_closing=close_issue
-            )
+                # Update workspace metadata; the in-memory model is current as
+                # soon as add_commit runs, so the disk write can happen in the
+                # background while the commit hash is returned immediately
+                workspace.add_commit(commit_hash)
+                workspace.git.commits_ahead += 1
+                self._spawn_background(
+                    self.workspace_manager.update_workspace_metadata(workspace)
+                )
             
-            # Update workspace metadata
-            workspace.add_commit(commit_hash)
-            await self.workspace_manager.update_workspace_metadata(workspace)
-            
-            return {
-                "success": True,
-                "commit_hash": commit_hash,
-                "workspace_name": workspace.name,
-                "issue_id": workspace.issue_id,
-                "message": message,
-                "closes_issue": close_issue
-            }
+                return {
+                    "success": True,
+                    "commit_hash": commit_hash,
+                    "workspace_name": workspace.name,
+                    "issue_id": workspace.issue_id,
+                    "message": message,
+                    "closes_issue": close_issue
+                }
             
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            except (ValueError, GitCommandError, OSError) as e:
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
     
     async def feature_status(self) -> Dict[str, Any]:
         """Get detailed status of the current feature."""
-        try:
-            # Get active workspace
-            workspace = await self.workspace_manager.get_active_workspace()
-            if not workspace:
-                raise ValueError("No active workspace found")
+        async with _GIT_SEMAPHORE:
+            try:
+                # Get active workspace
+                workspace = await self.workspace_manager.get_active_workspace()
+                if not workspace:
+                    raise ValueError("No active workspace found")
             
-            # Get current git status
-            if await self.git_manager.is_git_repository(workspace.path):
-                git_info = await self.git_manager.get_workspace_status(workspace.path)
-            else:
-                git_info = workspace.git
+                # Get current git status; the repo probe and the status read are
+                # independent, so overlap them and fall back to the saved info
+                # when the path turns out not to be a repository
+                is_repo, git_status = await asyncio.gather(
+                    self.git_manager.is_git_repository(workspace.path),
+                    self.git_manager.get_workspace_status(workspace.path),
+                    return_exceptions=True,
+                )
+                if is_repo is True and not isinstance(git_status, BaseException):
+                    git_info = git_status
+                else:
+                    git_info = workspace.git
             
-            return {
-                "success": True,
-                "workspace": workspace.name,
-                "branch": workspace.branch_name,
-                "issue": {
-                    "id": workspace.issue_id,
-                    "title": workspace.issue.title,
-                    "description": workspace.issue.description
-                },
-                "git": {
-                    "commits_ahead": git_info.commits_ahead,
-                    "commits_behind": git_info.commits_behind,
-                    "modified_files": git_info.modified_files,
-                    "staged_files": git_info.staged_files,
-                    "repo_url": git_info.repo_url,
-                    "base_branch": git_info.base_branch
-                },
-                "workspace_path": str(workspace.path),
-                "created_at": workspace.created_at.isoformat(),
-                "updated_at": workspace.updated_at.isoformat(),
-                "status": workspace.status.value
-            }
+                return {
+                    "success": True,
+                    "workspace": workspace.name,
+                    "branch": workspace.branch_name,
+                    "issue": {
+                        "id": workspace.issue_id,
+                        "title": workspace.issue.title,
+                        "description": workspace.issue.description
+                    },
+                    "git": {
+                        "commits_ahead": git_info.commits_ahead,
+                        "commits_behind": git_info.commits_behind,
+                        "modified_files": git_info.modified_files,
+                        "staged_files": git_info.staged_files,
+                        "repo_url": git_info.repo_url,
+                        "base_branch": git_info.base_branch
+                    },
+                    "workspace_path": workspace.path_str,
+                    "created_at": workspace.created_at.isoformat(),
+                    "updated_at": workspace.updated_at.isoformat(),
+                    "status": workspace.status.value
+                }
             
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            except (ValueError, GitCommandError, OSError) as e:
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
     
+    async def sync_feature(
+        self,
+        workspace_name: Optional[str] = None,
+        strategy: str = "rebase"
+    ) -> Dict[str, Any]:
+        """Sync a feature workspace with its base branch."""
+        # Fetch + rebase/merge + rev-list makes this the most git-heavy
+        # tool, so it shares the subprocess bound with the others
+        async with _GIT_SEMAPHORE:
+            try:
+                # Resolve the workspace, defaulting to the active one
+                if not workspace_name:
+                    active_workspace = await self.workspace_manager.get_active_workspace()
+                    if not active_workspace:
+                        raise ValueError(
+                            "No active workspace found and no workspace name provided"
+                        )
+                    workspace_name = active_workspace.name
+
+                commits_ahead, commits_behind, has_conflicts = (
+                    await self.workspace_manager.sync_workspace(workspace_name, strategy)
+                )
+
+                return {
+                    "success": True,
+                    "workspace_name": workspace_name,
+                    "strategy": strategy,
+                    "commits_ahead": commits_ahead,
+                    "commits_behind": commits_behind,
+                    "has_conflicts": has_conflicts,
+                    "message": f"Synced workspace {workspace_name} with base branch" +
+                              (" (conflicts detected)" if has_conflicts else "")
+                }
+
+            except (ValueError, GitCommandError, OSError) as e:
+                return {
+                    "success": False,
+                    "error": str(e)
+                }
+
     async def cleanup_features(
         self,
         older_than_days: int = 7,
@@ -220,7 +300,8 @@ class FeatureWorkflowServer:
         """Clean up old workspaces."""
         try:
             cleaned_workspaces = await self.workspace_manager.cleanup_old_workspaces(
-                days=older_than_days
+                days=older_than_days,
+                completed_only=completed_only
             )
             
             return {
@@ -229,18 +310,35 @@ class FeatureWorkflowServer:
                 "count": len(cleaned_workspaces)
             }
             
-        except Exception as e:
+        except (ValueError, GitCommandError, OSError) as e:
             return {
                 "success": False,
                 "error": str(e)
             }
 
 
+def _to_json(result: Dict[str, Any]) -> str:
+    """Serialize a tool result in one C-level pass."""
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+
 # Initialize FastMCP server
 mcp = FastMCP("Feature Workflow MCP Server")
 
-# Global feature server instance
-feature_server = FeatureWorkflowServer()
+# Process-wide server instance, shared with the tool modules so manager
+# caches (metadata, Repo objects) survive across tool invocations
+_server_singleton: Optional[FeatureWorkflowServer] = None
+
+
+def get_server() -> FeatureWorkflowServer:
+    """Get the shared FeatureWorkflowServer, creating it on first use."""
+    global _server_singleton
+    if _server_singleton is None:
+        _server_singleton = FeatureWorkflowServer()
+    return _server_singleton
+
+
+feature_server = get_server()
 
 
 @mcp.tool()
@@ -264,7 +362,7 @@ async def start_feature(
         description=description,
         base_branch=base_branch
     )
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
@@ -275,7 +373,7 @@ async def list_features() -> str:
         JSON string with list of all workspaces
     """
     result = await feature_server.list_features()
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
@@ -289,7 +387,7 @@ async def switch_feature(workspace_name: str) -> str:
         JSON string with switch result
     """
     result = await feature_server.switch_feature(workspace_name)
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
@@ -307,7 +405,7 @@ async def commit_feature(message: str, close_issue: bool = False) -> str:
         message=message,
         close_issue=close_issue
     )
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
@@ -318,7 +416,7 @@ async def feature_status() -> str:
         JSON string with current feature status
     """
     result = await feature_server.feature_status()
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
@@ -339,7 +437,7 @@ async def cleanup_features(
         older_than_days=older_than_days,
         completed_only=completed_only
     )
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 def main():
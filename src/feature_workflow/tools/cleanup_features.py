@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ..server import FeatureWorkflowServer
+from ..server import get_server
 
 
 async def cleanup_features_tool(
@@ -19,7 +19,7 @@ async def cleanup_features_tool(
     Returns:
         Dictionary with cleanup result
     """
-    server = FeatureWorkflowServer()
+    server = get_server()
     return await server.cleanup_features(
         older_than_days=older_than_days,
         completed_only=completed_only
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ..server import FeatureWorkflowServer
+from ..server import get_server
 
 
 async def commit_feature_tool(
@@ -19,7 +19,7 @@ async def commit_feature_tool(
     Returns:
         Dictionary with commit result
     """
-    server = FeatureWorkflowServer()
+    server = get_server()
     return await server.commit_feature(
         message=message,
         close_issue=close_issue
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ..server import FeatureWorkflowServer
+from ..server import get_server
 
 
 async def feature_status_tool() -> Dict[str, Any]:
@@ -12,5 +12,5 @@ async def feature_status_tool() -> Dict[str, Any]:
     Returns:
         Dictionary with current feature status
     """
-    server = FeatureWorkflowServer()
+    server = get_server()
     return await server.feature_status()
\ No newline at end of file
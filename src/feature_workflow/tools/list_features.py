@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ..server import FeatureWorkflowServer
+from ..server import get_server
 
 
 async def list_features_tool() -> Dict[str, Any]:
@@ -12,5 +12,5 @@ async def list_features_tool() -> Dict[str, Any]:
     Returns:
         Dictionary with list of workspaces and their status
     """
-    server = FeatureWorkflowServer()
+    server = get_server()
     return await server.list_features()
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, Optional
 
-from ..server import FeatureWorkflowServer
+from ..server import get_server
 
 
 async def start_feature_tool(
@@ -21,7 +21,7 @@ async def start_feature_tool(
     Returns:
         Dictionary with workspace creation result
     """
-    server = FeatureWorkflowServer()
+    server = get_server()
     return await server.start_feature(
         issue_id=issue_id,
         description=description,
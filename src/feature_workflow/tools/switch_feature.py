@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ..server import FeatureWorkflowServer
+from ..server import get_server
 
 
 async def switch_feature_tool(workspace_name: str) -> Dict[str, Any]:
@@ -15,5 +15,5 @@ async def switch_feature_tool(workspace_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary with switch result
     """
-    server = FeatureWorkflowServer()
+    server = get_server()
     return await server.switch_feature(workspace_name)
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ..server import FeatureWorkflowServer
+from ..server import get_server
 
 
 async def sync_feature_tool(
@@ -19,37 +19,8 @@ async def sync_feature_tool(
     Returns:
         Dictionary with sync result
     """
-    server = FeatureWorkflowServer()
-    
-    try:
-        # Get workspace name
-        if not workspace_name:
-            active_workspace = await server.workspace_manager.get_active_workspace()
-            if not active_workspace:
-                return {
-                    "success": False,
-                    "error": "No active workspace found and no workspace name provided"
-                }
-            workspace_name = active_workspace.name
-        
-        # Sync workspace
-        commits_ahead, commits_behind, has_conflicts = await server.workspace_manager.sync_workspace(
-            workspace_name, strategy
-        )
-        
-        return {
-            "success": True,
-            "workspace_name": workspace_name,
-            "strategy": strategy,
-            "commits_ahead": commits_ahead,
-            "commits_behind": commits_behind,
-            "has_conflicts": has_conflicts,
-            "message": f"Synced workspace {workspace_name} with base branch" + 
-                      (" (conflicts detected)" if has_conflicts else "")
-        }
-        
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
\ No newline at end of file
+    server = get_server()
+    return await server.sync_feature(
+        workspace_name=workspace_name,
+        strategy=strategy
+    )
\ No newline at end of file
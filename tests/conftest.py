@@ -1,34 +1,70 @@
 """Test configuration and fixtures for feature workflow MCP server."""
 
-import tempfile
+import os
 from pathlib import Path
-from typing import Generator
 import pytest
+import uvloop
 from unittest.mock import Mock
 
 from feature_workflow.config import FeatureWorkflowConfig
+from feature_workflow.managers.workspace_manager import WorkspaceManager
 from feature_workflow.models.workspace import LinearIssue, GitInfo, WorkspaceMetadata
 
 
-@pytest.fixture
-def temp_workspace_dir() -> Generator[Path, None, None]:
-    """Create a temporary workspace directory for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+@pytest.fixture(scope="session")
+def event_loop_policy() -> uvloop.EventLoopPolicy:
+    """Run async tests on uvloop's libuv-backed event loop."""
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture
-def test_config(temp_workspace_dir: Path) -> FeatureWorkflowConfig:
-    """Create a test configuration with temporary workspace directory."""
+def temp_workspace_dir(fs) -> Path:
+    """Create a workspace directory on pyfakefs' in-memory filesystem.
+
+    Workspace tests are syscall-bound; faking the filesystem turns every
+    mkdir/write/rmtree into a dict operation and removes teardown cost.
+    """
+    fs.create_dir("/ws")
+    # Config derives its metadata/worktree paths from the working directory,
+    # so anchor the fake cwd here and everything stays on the fake fs. The
+    # metadata dir is pre-created because the session-scoped config only
+    # mkdirs it once, on the first fake filesystem
+    fs.create_dir("/ws/.feature-workflow")
+    os.chdir("/ws")
+    return Path("/ws")
+
+
+@pytest.fixture(scope="session")
+def test_config() -> FeatureWorkflowConfig:
+    """Create the shared test configuration.
+
+    Session-scoped so the settings model (and its nested sections) is
+    built and validated once, not per test. Tests that need different
+    values must mutate a ``model_copy(deep=True)``, never this instance.
+    """
     config = FeatureWorkflowConfig()
-    config.workspace.base_dir = temp_workspace_dir
-    config.workspace.max_workspaces = 5
+    config.workspace.max_worktrees = 5
     config.workspace.auto_cleanup_days = 1
     config.git.default_base_branch = "main"
     config.linear.issue_prefix = "TEST"
     return config
 
 
+@pytest.fixture
+def manager(
+    test_config: FeatureWorkflowConfig, temp_workspace_dir: Path
+) -> WorkspaceManager:
+    """WorkspaceManager under test.
+
+    Function-scoped on purpose: the fake filesystem resets between tests,
+    so a longer-lived manager would carry caches for files that no longer
+    exist. Construction itself is cheap once the config fixture is shared.
+    Depends on the workspace dir so the fake filesystem is in place before
+    the manager touches the metadata directory.
+    """
+    return WorkspaceManager(test_config)
+
+
 @pytest.fixture
 def sample_linear_issue() -> LinearIssue:
     """Create a sample Linear issue for testing."""
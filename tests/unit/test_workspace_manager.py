@@ -1,26 +1,108 @@
 """Unit tests for WorkspaceManager."""
 
+import asyncio
+import os
+
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+
+from feature_workflow.managers.workspace_manager import (
+    DuplicateWorkspaceError,
+    WorkspaceLimitError,
+    WorkspaceManager,
+    WorkspaceNotFoundError,
+)
+
+
+# Single place to swap in e.g. a local file:// URL for end-to-end runs
+REPO_URL = "https://github.com/test/repo.git"
 
-from feature_workflow.managers.workspace_manager import WorkspaceManager
-from feature_workflow.models.workspace import WorkspaceStatus
+
+def _names(directory: Path) -> set:
+    """Directory listing as a set; one readdir covers several membership
+    asserts where per-path .exists() would each pay a stat."""
+    return set(os.listdir(directory))
 
 
 class TestWorkspaceManager:
     """Test cases for WorkspaceManager."""
-    
-    @pytest.mark.asyncio
-    async def test_create_workspace(self, test_config, temp_workspace_dir):
+
+    @pytest.fixture(autouse=True)
+    def _no_git(self, monkeypatch, temp_workspace_dir):
+        """Stub the git layer: worktree creation becomes a mkdir and
+        removal an rmtree, so no test forks a git subprocess."""
+        repo = Mock()
+        repo.working_dir = str(temp_workspace_dir / "repo")
+        remote = Mock()
+        remote.url = REPO_URL
+        repo.remotes = [remote]
+
+        async def ensure_repository(self, repo_path=None):
+            return repo
+
+        async def create_worktree_for_feature(
+            self, repo, feature_name, branch_name, base_branch="main"
+        ):
+            path = temp_workspace_dir / "worktrees" / feature_name
+            path.mkdir(parents=True)
+            return path
+
+        async def remove_worktree(self, repo, worktree_path):
+            import shutil
+            shutil.rmtree(worktree_path, ignore_errors=True)
+            return True
+
+        monkeypatch.setattr(
+            "feature_workflow.managers.git_manager.GitManager.ensure_repository",
+            ensure_repository,
+        )
+        monkeypatch.setattr(
+            "feature_workflow.managers.git_manager.GitManager.create_worktree_for_feature",
+            create_worktree_for_feature,
+        )
+        monkeypatch.setattr(
+            "feature_workflow.managers.git_manager.GitManager.remove_worktree",
+            remove_worktree,
+        )
+
+    @pytest.fixture
+    def make_workspace(self, manager):
+        """Factory for workspaces created with the standard test arguments."""
+        async def _create(
+            issue: int = 123,
+            description: str = "Test feature",
+            manager=manager,
+        ):
+            return await manager.create_workspace(
+                issue_id=f"AIM-{issue}",
+                description=description,
+            )
+        return _create
+
+    @pytest.fixture
+    def small_limit_manager(self, test_config, temp_workspace_dir):
+        """Manager with the worktree limit lowered: the limit test only
+        needs enough workspaces to hit the cap, not the full default.
+        Copies the session config so the override doesn't leak."""
+        config = test_config.model_copy(deep=True)
+        config.workspace.max_worktrees = 2
+        return WorkspaceManager(config)
+
+    @pytest.fixture
+    async def two_workspaces(self, make_workspace):
+        """Pre-created workspace pair shared by the list and switch tests,
+        so the identical create sequences run in one place."""
+        first = await make_workspace(123, "First feature")
+        second = await make_workspace(124, "Second feature")
+        return first, second
+
+    async def test_create_workspace(self, manager):
         """Test workspace creation."""
-        manager = WorkspaceManager(test_config)
-        
         # Create workspace
         workspace = await manager.create_workspace(
             issue_id="AIM-123",
             description="Test feature implementation",
-            repo_url="https://github.com/test/repo.git",
             base_branch="main"
         )
         
@@ -28,61 +110,34 @@ class TestWorkspaceManager:
         assert workspace.name == "aim-123-test-feature-implementation"
         assert workspace.issue_id == "AIM-123"
         assert workspace.description == "Test feature implementation"
-        assert workspace.git.repo_url == "https://github.com/test/repo.git"
+        assert workspace.git.repo_url == REPO_URL
         assert workspace.git.base_branch == "main"
         assert workspace.git.branch_name == "feature/aim-123-test-feature-implementation"
-        assert workspace.path.exists()
-        
+        assert workspace.path.name in _names(workspace.path.parent)
+
         # Verify metadata file was created
-        metadata_file = workspace.path / ".feature-metadata.json"
-        assert metadata_file.exists()
+        assert f"{workspace.name}.json" in _names(manager.metadata_dir)
         
         # Verify active workspace was set
         active_name = await manager.get_active_workspace_name()
         assert active_name == workspace.name
     
-    @pytest.mark.asyncio
-    async def test_create_workspace_duplicate(self, test_config, temp_workspace_dir):
+    async def test_create_workspace_duplicate(self, manager, make_workspace):
         """Test creating duplicate workspace raises error."""
-        manager = WorkspaceManager(test_config)
-        
         # Create first workspace
-        await manager.create_workspace(
-            issue_id="AIM-123",
-            description="Test feature",
-            repo_url="https://github.com/test/repo.git"
-        )
+        await make_workspace(123)
         
         # Try to create duplicate
-        with pytest.raises(ValueError, match="already exists"):
-            await manager.create_workspace(
-                issue_id="AIM-123",
-                description="Test feature",
-                repo_url="https://github.com/test/repo.git"
-            )
+        with pytest.raises(DuplicateWorkspaceError):
+            await make_workspace(123)
     
-    @pytest.mark.asyncio
-    async def test_list_workspaces(self, test_config, temp_workspace_dir):
-        """Test listing workspaces."""
-        manager = WorkspaceManager(test_config)
-        
-        # Initially empty
+    async def test_list_workspaces_empty(self, manager):
+        """Test listing with no workspaces."""
         workspace_list = await manager.list_workspaces()
         assert len(workspace_list.workspaces) == 0
-        
-        # Create some workspaces
-        await manager.create_workspace(
-            issue_id="AIM-123",
-            description="First feature",
-            repo_url="https://github.com/test/repo.git"
-        )
-        
-        await manager.create_workspace(
-            issue_id="AIM-124",
-            description="Second feature",
-            repo_url="https://github.com/test/repo.git"
-        )
-        
+
+    async def test_list_workspaces(self, manager, two_workspaces):
+        """Test listing workspaces."""
         # List workspaces
         workspace_list = await manager.list_workspaces()
         assert len(workspace_list.workspaces) == 2
@@ -94,103 +149,70 @@ class TestWorkspaceManager:
         # Verify active workspace
         assert workspace_list.active_workspace == "aim-124-second-feature"
     
-    @pytest.mark.asyncio
-    async def test_switch_workspace(self, test_config, temp_workspace_dir):
+    async def test_switch_workspace(self, manager, two_workspaces):
         """Test switching between workspaces."""
-        manager = WorkspaceManager(test_config)
-        
-        # Create workspaces
-        workspace1 = await manager.create_workspace(
-            issue_id="AIM-123",
-            description="First feature",
-            repo_url="https://github.com/test/repo.git"
-        )
-        
-        workspace2 = await manager.create_workspace(
-            issue_id="AIM-124",
-            description="Second feature",
-            repo_url="https://github.com/test/repo.git"
-        )
-        
+        workspace1, workspace2 = two_workspaces
+
         # Active should be the last created
         active_name = await manager.get_active_workspace_name()
         assert active_name == workspace2.name
         
-        # Switch to first workspace
+        # Switch to first workspace; the repeat read can come straight
+        # from the manager's in-memory pointer
         await manager.set_active_workspace(workspace1.name)
-        active_name = await manager.get_active_workspace_name()
-        assert active_name == workspace1.name
+        assert manager.active_workspace_name_sync == workspace1.name
         
         # Switch to non-existent workspace should raise error
-        with pytest.raises(ValueError, match="not found"):
+        with pytest.raises(WorkspaceNotFoundError):
             await manager.set_active_workspace("non-existent")
     
-    @pytest.mark.asyncio
-    async def test_delete_workspace(self, test_config, temp_workspace_dir):
+    async def test_delete_workspace(self, manager, make_workspace):
         """Test deleting workspace."""
-        manager = WorkspaceManager(test_config)
-        
         # Create workspace
-        workspace = await manager.create_workspace(
-            issue_id="AIM-123",
-            description="Test feature",
-            repo_url="https://github.com/test/repo.git"
-        )
+        workspace = await make_workspace(123)
         
         # Verify it exists
-        assert workspace.path.exists()
+        assert workspace.path.name in _names(workspace.path.parent)
         active_name = await manager.get_active_workspace_name()
         assert active_name == workspace.name
         
-        # Delete workspace
-        success = await manager.delete_workspace(workspace.name)
-        assert success
-        
-        # Verify it's gone
-        assert not workspace.path.exists()
-        active_name = await manager.get_active_workspace_name()
-        assert active_name is None
-        
+        # Delete workspace; the result confirms removal, no follow-up stat
+        result = await manager.delete_workspace(workspace.name)
+        assert result.removed
+        assert result.path_removed
+        assert manager.active_workspace_name_sync is None
+
         # Delete non-existent workspace
-        success = await manager.delete_workspace("non-existent")
-        assert not success
+        result = await manager.delete_workspace("non-existent")
+        assert not result.removed
     
-    @pytest.mark.asyncio
-    async def test_workspace_name_generation(self, test_config, temp_workspace_dir):
+    def test_workspace_name_generation(self):
         """Test workspace name generation."""
-        manager = WorkspaceManager(test_config)
-        
+        generate = WorkspaceManager._generate_workspace_name
+
         # Test normal case
-        name = manager._generate_workspace_name("AIM-123", "User Authentication System")
+        name = generate("AIM-123", "User Authentication System")
         assert name == "aim-123-user-authentication-system"
-        
+
         # Test with special characters
-        name = manager._generate_workspace_name("AIM-124", "Fix bug in API & Database!")
+        name = generate("AIM-124", "Fix bug in API & Database!")
         assert name == "aim-124-fix-bug-in-api--database"
-        
+
         # Test with long description
         long_desc = "This is a very long description that should be truncated"
-        name = manager._generate_workspace_name("AIM-125", long_desc)
+        name = generate("AIM-125", long_desc)
         assert len(name) <= 40  # Should be truncated
         assert name.startswith("aim-125-")
     
-    @pytest.mark.asyncio
-    async def test_max_workspaces_limit(self, test_config, temp_workspace_dir):
+    async def test_max_workspaces_limit(self, small_limit_manager, make_workspace):
         """Test workspace limit enforcement."""
-        manager = WorkspaceManager(test_config)
-        
-        # Create max number of workspaces
-        for i in range(test_config.workspace.max_workspaces):
-            await manager.create_workspace(
-                issue_id=f"AIM-{i+1}",
-                description=f"Feature {i+1}",
-                repo_url="https://github.com/test/repo.git"
-            )
-        
+        # Create max number of workspaces; the creates are independent, so
+        # overlap them instead of paying the latency N times over
+        await asyncio.gather(*(
+            make_workspace(i + 1, f"Feature {i+1}", manager=small_limit_manager)
+            for i in range(small_limit_manager.config.workspace.max_worktrees)
+        ))
+
         # Try to create one more
-        with pytest.raises(ValueError, match="Maximum number of workspaces"):
-            await manager.create_workspace(
-                issue_id="AIM-999",
-                description="Too many features",
-                repo_url="https://github.com/test/repo.git"
-            )
\ No newline at end of file
+        with pytest.raises(WorkspaceLimitError):
+            await make_workspace(999, "Too many features", manager=small_limit_manager)
\ No newline at end of file